@@ -5,9 +5,10 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 import os
 from pathlib import Path
 
@@ -78,37 +79,77 @@ activities = {
 }
 
 
+def get_activity_db():
+    """Return the activity database used by the endpoints"""
+    return activities
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
+def get_activities(activities: dict = Depends(get_activity_db)):
     return activities
 
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
+class SignupOp(BaseModel):
+    activity: str
+    email: str
+
+
+class BatchSignup(BaseModel):
+    ops: list[SignupOp]
+
+
+def _check_signup(activities, activity_name, email, pending=frozenset()):
+    """Raise an HTTPException if the student cannot sign up for the activity"""
     # Validate activity exists
     if activity_name not in activities:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
-    
-    #Validate student not already signed up
-    if email in activity["participants"]:
+    # Validate student not already signed up, here or earlier in the batch
+    if (email in activities[activity_name]["participants"]
+            or (activity_name, email) in pending):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
+
+# Registered before the per-activity route so "batch" is not read as an
+# activity name
+@app.post("/activities/batch/signup")
+def batch_signup_for_activities(batch: BatchSignup,
+                                activities: dict = Depends(get_activity_db)):
+    """Sign up students for several activities in one all-or-nothing request"""
+    pending = set()
+    for index, op in enumerate(batch.ops):
+        try:
+            _check_signup(activities, op.activity, op.email, pending)
+        except HTTPException as exc:
+            raise HTTPException(status_code=exc.status_code,
+                                detail=f"Operation {index} failed: {exc.detail}")
+        pending.add((op.activity, op.email))
+
+    # Every operation is valid, so hand each one to the single signup handler
+    messages = [signup_for_activity(op.activity, op.email, activities)["message"]
+                for op in batch.ops]
+    return {"messages": messages}
+
+
+@app.post("/activities/{activity_name}/signup")
+def signup_for_activity(activity_name: str, email: str,
+                        activities: dict = Depends(get_activity_db)):
+    """Sign up a student for an activity"""
+    _check_signup(activities, activity_name, email)
+
     # Add student
-    activity["participants"].append(email)
+    activities[activity_name]["participants"].append(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.post("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             activities: dict = Depends(get_activity_db)):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
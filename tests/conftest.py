@@ -1,5 +1,313 @@
+import json
+import os
+import pickle
+import re
+import shlex
+import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 # Add the src directory to the path so we can import the app
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx
+import pytest
+import pytest_asyncio
+from app import app, get_activity_db
+
+
+# Wall-clock seconds spent in each pytest phase, filled in by the hooks below
+_phase_durations = {}
+# Slowest duration of each phase across xdist workers, filled in on the controller
+_worker_phase_durations = {}
+# Whether the gate tripped, set in pytest_sessionfinish for the terminal summary
+_collection_regressed_key = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--collection-ratio-limit",
+        type=float,
+        default=None,
+        metavar="RATIO",
+        help="Report collection and run-loop timings and fail the session "
+             "if collection takes longer than RATIO times the run loop",
+    )
+
+
+def _timed(phase):
+    """Build a hook wrapper that records how long the wrapped phase takes"""
+    @pytest.hookimpl(wrapper=True)
+    def wrapper(session):
+        start = time.perf_counter()
+        try:
+            return (yield)
+        finally:
+            _phase_durations[phase] = time.perf_counter() - start
+    return wrapper
+
+
+pytest_collection = _timed("pytest_collection")
+pytest_runtestloop = _timed("pytest_runtestloop")
+
+
+def _reported_durations():
+    """Return the phase durations the gate applies to
+
+    Under xdist the controller neither collects nor runs tests itself, so the
+    slowest worker's timings stand in for its own.
+    """
+    return _worker_phase_durations or _phase_durations
+
+
+def _collection_regressed(session):
+    """Return True if collection took longer than the configured ratio allows"""
+    limit = session.config.getoption("collection_ratio_limit")
+    # With --co or nothing selected the run loop does no work to compare against
+    if limit is None or session.config.option.collectonly or not session.testscollected:
+        return False
+    durations = _reported_durations()
+    collection = durations.get("pytest_collection")
+    loop = durations.get("pytest_runtestloop")
+    if collection is None or loop is None:
+        return False
+    return collection > limit * loop
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge a finished xdist worker's phase timings on the controller"""
+    for phase, seconds in node.workeroutput.get("phase_durations", {}).items():
+        _worker_phase_durations[phase] = max(seconds, _worker_phase_durations.get(phase, 0.0))
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workeroutput"):
+        # xdist worker: hand the timings to the controller, which applies the gate
+        session.config.workeroutput["phase_durations"] = dict(_phase_durations)
+        return
+    regressed = _collection_regressed(session)
+    session.config.stash[_collection_regressed_key] = regressed
+    # Only turn a clean run into a failure; keep interrupts and errors as-is
+    if regressed and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    limit = config.getoption("collection_ratio_limit")
+    if limit is None:
+        return
+    terminalreporter.section("phase timings")
+    if _worker_phase_durations:
+        terminalreporter.write_line("slowest xdist worker per phase:")
+    for phase, seconds in _reported_durations().items():
+        terminalreporter.write_line(f"{phase}: {seconds * 1000:.1f} ms")
+    if config.stash.get(_collection_regressed_key, False):
+        terminalreporter.write_line(
+            f"collection took more than {limit:g}x the run loop", red=True
+        )
+
+
+# Set for the child pytest run: the isolated test runs in-process there and
+# its serialized reports are appended, one JSON object per line, to this file
+_ISOLATED_RESULTS_ENV = "MERGINGTON_ISOLATED_RESULTS"
+
+# The only parent options an isolated child run receives, as flags and as
+# options taking a value; the rest, from xdist and the cache to the
+# collection gate, applies to the parent session
+_CHILD_FLAGS = ("-q", "--quiet", "-v", "--verbose", "-l", "--showlocals", "--runxfail")
+_CHILD_OPTIONS = (
+    "-p", "-W", "--pythonwarnings", "-o", "--override-ini", "-c", "--config-file",
+    "--rootdir", "--import-mode", "--tb",
+)
+
+
+def _isolated_child_args(config):
+    """Return the allow-listed options from PYTEST_ADDOPTS and the command line"""
+    parent_args = [*shlex.split(os.environ.get("PYTEST_ADDOPTS", "")),
+                   *config.invocation_params.args]
+    short_options = tuple(option for option in _CHILD_OPTIONS if len(option) == 2)
+    long_options = tuple(f"{option}=" for option in _CHILD_OPTIONS if len(option) > 2)
+    args = []
+    take_value = False
+    for arg in parent_args:
+        if take_value:
+            args.append(arg)
+            take_value = False
+        elif arg in _CHILD_OPTIONS:
+            args.append(arg)
+            take_value = True
+        elif (arg in _CHILD_FLAGS or re.fullmatch(r"-[vq]+", arg)
+              or arg.startswith(short_options) or arg.startswith(long_options)):
+            args.append(arg)
+    return args
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """In an isolated child run, record each phase report for the parent"""
+    report = yield
+    path = os.environ.get(_ISOLATED_RESULTS_ENV)
+    if path is not None:
+        data = item.config.hook.pytest_report_to_serializable(config=item.config, report=report)
+        with open(path, "a") as results:
+            results.write(json.dumps(data) + "\n")
+    return report
+
+
+def _isolated_failure(item, message):
+    """Build a failed call report for an isolated run that gave no failure of its own"""
+    return pytest.TestReport(item.nodeid, item.location, {name: 1 for name in item.keywords},
+                             "failed", message, "call")
+
+
+def _run_isolated(item):
+    """Run a single test in a fresh pytest process and return its phase reports"""
+    config = item.config
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results_path = os.path.join(tmpdir, "results.jsonl")
+        env = {name: value for name, value in os.environ.items() if name != "PYTEST_ADDOPTS"}
+        env[_ISOLATED_RESULTS_ENV] = results_path
+        command = [
+            sys.executable, "-m", "pytest", str(config.rootpath / item.nodeid),
+            *_isolated_child_args(config), "-p", "no:cacheprovider",
+        ]
+        child = subprocess.run(command, cwd=config.invocation_params.dir, env=env,
+                               capture_output=True, text=True)
+        reports = []
+        if os.path.exists(results_path):
+            with open(results_path) as results:
+                reports = [
+                    config.hook.pytest_report_from_serializable(config=config, data=json.loads(line))
+                    for line in results
+                ]
+        for report in reports:
+            # JSON turns a skip's (path, lineno, reason) tuple into a list
+            if isinstance(report.longrepr, list):
+                report.longrepr = tuple(report.longrepr)
+
+    if child.returncode != pytest.ExitCode.OK and not any(report.failed for report in reports):
+        # Nothing the child reported explains its exit code, so show its output
+        return [_isolated_failure(
+            item, f"isolated run of {item.nodeid} exited with code {child.returncode}\n"
+                  f"{child.stdout}{child.stderr}",
+        )]
+    return reports
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Run tests marked isolated in a separate pytest process with clean module state
+
+    Each run costs a fresh interpreter and app import, so only tests that need
+    untouched module globals should opt in; everything else runs in-process
+    with the session client and reset_activities. The parent sets up no
+    fixtures for an isolated test; it replays the child's reports instead.
+    """
+    if item.get_closest_marker("isolated") is None:
+        return None
+    if os.environ.get(_ISOLATED_RESULTS_ENV):
+        return None
+
+    ihook = item.ihook
+    ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    for report in _run_isolated(item):
+        ihook.pytest_runtest_logreport(report=report)
+    # Tear down the previous test's fixtures that nextitem does not share,
+    # as the default protocol would at the end of this test
+    teardown = pytest.CallInfo.from_call(
+        lambda: item.session._setupstate.teardown_exact(nextitem), when="teardown"
+    )
+    if teardown.excinfo is not None:
+        ihook.pytest_runtest_logreport(report=ihook.pytest_runtest_makereport(item=item, call=teardown))
+    ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+# Canonical activity state, built once at import time
+_BASELINE = {
+    "Debate Club": {
+        "description": "Develop public speaking and critical thinking skills",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ["alex@mergington.edu"]
+    },
+    "Science Olympiad": {
+        "description": "Compete in science competitions and experiments",
+        "schedule": "Saturdays, 10:00 AM - 12:00 PM",
+        "max_participants": 15,
+        "participants": ["james@mergington.edu", "lily@mergington.edu"]
+    },
+    "Basketball": {
+        "description": "Team basketball practice and games",
+        "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["tyler@mergington.edu"]
+    },
+    "Soccer": {
+        "description": "Outdoor soccer training and matches",
+        "schedule": "Tuesdays and Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["maya@mergington.edu", "lucas@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Stage performances and theatrical productions",
+        "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ["grace@mergington.edu"]
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and sculpture instruction",
+        "schedule": "Saturdays, 1:00 PM - 3:00 PM",
+        "max_participants": 12,
+        "participants": ["rachel@mergington.edu", "noah@mergington.edu"]
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+# Pickled once at import; unpickling is cheaper than deep-copying the dict
+_BASELINE_BLOB = pickle.dumps(_BASELINE, protocol=5)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async ASGI client for the app, shared across the session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def baseline():
+    """Return a private copy of the canonical activity state for each test"""
+    return pickle.loads(_BASELINE_BLOB)
+
+
+@pytest.fixture
+def reset_activities():
+    """Inject a fresh copy of the baseline activities and yield it to the test"""
+    activities = pickle.loads(_BASELINE_BLOB)
+    app.dependency_overrides[get_activity_db] = lambda: activities
+
+    yield activities
+
+    del app.dependency_overrides[get_activity_db]
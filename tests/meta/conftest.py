@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+
+pytest_plugins = ["pytester"]
+
+CONFTEST = Path(__file__).parent.parent / "conftest.py"
+SRC = Path(__file__).parent.parent.parent / "src"
+
+
+@pytest.fixture
+def plugin_pytester(pytester):
+    """Return a pytester project that loads this suite's conftest plugins"""
+    pytester.makeini(f"""
+        [pytest]
+        pythonpath = {SRC}
+        asyncio_default_fixture_loop_scope = session
+        markers =
+            isolated: run the test in a separate pytest process
+    """)
+    pytester.makeconftest(CONFTEST.read_text())
+    return pytester
@@ -0,0 +1,33 @@
+import pytest
+
+
+class TestCollectionRatioLimit:
+    """Tests for the --collection-ratio-limit phase timing gate"""
+
+    def test_limit_exceeded_fails_run(self, plugin_pytester):
+        """Test that a run whose collection exceeds the limit fails"""
+        plugin_pytester.makepyfile("def test_ok():\n    pass\n")
+        result = plugin_pytester.runpytest_inprocess("--collection-ratio-limit=0")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        result.stdout.fnmatch_lines(["*collection took more than 0x the run loop*"])
+
+    def test_limit_met_passes_run(self, plugin_pytester):
+        """Test that a run within the limit passes and reports its timings"""
+        plugin_pytester.makepyfile("def test_ok():\n    pass\n")
+        result = plugin_pytester.runpytest_inprocess("--collection-ratio-limit=1e9")
+        assert result.ret == pytest.ExitCode.OK
+        result.stdout.fnmatch_lines(["*phase timings*", "pytest_collection: *ms"])
+
+    def test_collect_only_is_not_gated(self, plugin_pytester):
+        """Test that --co passes even though its run loop does no work"""
+        plugin_pytester.makepyfile("def test_ok():\n    pass\n")
+        result = plugin_pytester.runpytest_inprocess("--co", "--collection-ratio-limit=0")
+        assert result.ret == pytest.ExitCode.OK
+        result.stdout.no_fnmatch_line("*collection took more than*")
+
+    def test_limit_exceeded_fails_xdist_run(self, plugin_pytester):
+        """Test that the gate applies the xdist workers' timings on the controller"""
+        plugin_pytester.makepyfile("def test_ok():\n    pass\n")
+        result = plugin_pytester.runpytest_subprocess("--collection-ratio-limit=0", "-n", "2")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        result.stdout.fnmatch_lines(["slowest xdist worker per phase:"])
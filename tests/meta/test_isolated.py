@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+
+ISOLATED_TESTS = """
+import pytest
+
+pytestmark = pytest.mark.isolated
+
+def test_pass():
+    pass
+
+def test_fail():
+    assert 1 == 2
+
+def test_skip():
+    pytest.skip("not today")
+
+def test_xfail():
+    pytest.xfail("known bug")
+
+@pytest.mark.xfail(reason="marked")
+def test_xfail_marker():
+    assert False
+"""
+
+# Checks, inside the child, that only allow-listed parent options arrived
+CHILD_OPTIONS_TEST = """
+import os
+
+import pytest
+
+@pytest.mark.isolated
+def test_child_options(request):
+    config = request.config
+    assert "PYTEST_ADDOPTS" not in os.environ
+    assert not hasattr(config, "workerinput")
+    assert not config.getoption("lf", False)
+    assert not config.getoption("stepwise", False)
+    assert config.getoption("collection_ratio_limit") is None
+    assert config.getoption("verbose") == 1
+"""
+
+# Records which process set up each test's fixtures
+FIXTURE_TESTS = """
+import os
+
+import pytest
+
+@pytest.fixture(scope="module", autouse=True)
+def module_state():
+    yield
+
+@pytest.fixture
+def record(request):
+    with open(os.environ["SETUPS_FILE"], "a") as setups:
+        setups.write(f"{request.node.name} {os.getpid()}\\n")
+
+def test_plain(record):
+    pass
+
+@pytest.mark.isolated
+def test_isolated(record):
+    pass
+"""
+
+
+class TestIsolatedMarker:
+    """Tests for running tests marked isolated in a separate pytest process"""
+
+    def test_outcomes_are_replayed(self, plugin_pytester):
+        """Test that the child's pass, fail, skip and xfail reports reach the parent run"""
+        plugin_pytester.makepyfile(test_isolated=ISOLATED_TESTS)
+        result = plugin_pytester.runpytest_inprocess("-rs")
+        result.assert_outcomes(passed=1, failed=1, skipped=1, xfailed=2)
+        result.stdout.fnmatch_lines(["E       assert 1 == 2"])
+
+        # The skip is reported where the test called pytest.skip
+        skip_line = ISOLATED_TESTS.strip().splitlines().index('    pytest.skip("not today")')
+        result.stdout.fnmatch_lines([f"SKIPPED [[]1[]] test_isolated.py:{skip_line + 1}: not today"])
+
+    def test_child_gets_only_allow_listed_options(self, plugin_pytester, monkeypatch):
+        """Test that parent-only options stay out of the child, even via PYTEST_ADDOPTS"""
+        plugin_pytester.makepyfile(test_child=CHILD_OPTIONS_TEST)
+        monkeypatch.setenv("PYTEST_ADDOPTS", "-n 1 --lf --sw")
+        result = plugin_pytester.runpytest_inprocess("-v", "--collection-ratio-limit=1e9")
+        result.assert_outcomes(passed=1)
+
+    def test_parent_sets_up_no_fixtures(self, plugin_pytester, monkeypatch):
+        """Test that only the child sets up an isolated test's fixtures"""
+        setups_file = plugin_pytester.path / "setups.txt"
+        monkeypatch.setenv("SETUPS_FILE", str(setups_file))
+        plugin_pytester.makepyfile(test_fixtures=FIXTURE_TESTS)
+        plugin_pytester.makepyfile(test_later="def test_later():\n    pass\n")
+        result = plugin_pytester.runpytest_inprocess()
+        result.assert_outcomes(passed=3)
+
+        setups = [line.split() for line in setups_file.read_text().splitlines()]
+        in_parent = [(name, pid == str(os.getpid())) for name, pid in setups]
+        assert in_parent == [("test_plain", True), ("test_isolated", False)]
@@ -0,0 +1,143 @@
+import pytest
+
+
+# Every test in this module changes activities, so each one starts from the
+# baseline; read-only tests live in test_app_readonly.py and skip the reset.
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("reset_activities")]
+
+ALEX = "alex@mergington.edu"
+JAMES = "james@mergington.edu"
+LILY = "lily@mergington.edu"
+NEW = "newstudent@mergington.edu"
+
+# Error-path requests, built once at import: (url, status, detail substring)
+_ERROR_CASES = [
+    pytest.param("/activities/Nonexistent Club/signup?email=student@mergington.edu",
+                 404, "not found", id="signup-missing"),
+    pytest.param(f"/activities/Debate Club/signup?email={ALEX}",
+                 400, "already signed up", id="signup-duplicate"),
+    pytest.param("/activities/Nonexistent Club/unregister?email=student@mergington.edu",
+                 404, "not found", id="unregister-missing"),
+    pytest.param("/activities/Debate Club/unregister?email=notregistered@mergington.edu",
+                 400, "not registered", id="unregister-absent"),
+]
+
+
+@pytest.fixture
+def activity(request, reset_activities):
+    """Resolve an indirectly parametrized activity name, checking it exists"""
+    assert request.param in reset_activities
+    return request.param
+
+
+class TestSignupForActivity:
+    """Tests for the POST /activities/{activity_name}/signup endpoint"""
+    
+    @pytest.mark.parametrize(
+        "activity", ["Debate Club", "Chess Club"], indirect=True, ids=["debate", "chess"]
+    )
+    async def test_signup_successfully(self, client, activity):
+        """Test successful signup for an activity"""
+        response = await client.post(f"/activities/{activity}/signup?email={NEW}")
+        assert response.status_code == 200
+        assert b"Signed up" in response.content
+    
+    async def test_signup_adds_participant(self, client, reset_activities):
+        """Test that signup actually adds the participant"""
+        await client.post(f"/activities/Debate Club/signup?email={NEW}")
+
+        assert NEW in reset_activities["Debate Club"]["participants"]
+    
+    async def test_signup_same_student_multiple_activities(self, client, reset_activities):
+        """Test that a student can sign up for multiple different activities"""
+        # alex is already in Debate Club, sign them up for another
+        response = await client.post(
+            f"/activities/Chess Club/signup?email={ALEX}"
+        )
+        assert response.status_code == 200
+        
+        # Verify they're in both activities
+        assert ALEX in reset_activities["Debate Club"]["participants"]
+        assert ALEX in reset_activities["Chess Club"]["participants"]
+
+
+class TestBatchSignup:
+    """Tests for the POST /activities/batch/signup endpoint"""
+
+    async def test_batch_signup_successfully(self, client, reset_activities):
+        """Test that one request signs a student up for several activities"""
+        response = await client.post("/activities/batch/signup", json={"ops": [
+            {"activity": "Debate Club", "email": NEW},
+            {"activity": "Chess Club", "email": NEW},
+        ]})
+        assert response.status_code == 200
+        assert len(response.json()["messages"]) == 2
+
+        assert NEW in reset_activities["Debate Club"]["participants"]
+        assert NEW in reset_activities["Chess Club"]["participants"]
+
+    async def test_batch_signup_error_applies_nothing(self, client, reset_activities):
+        """Test that a failing operation rejects the whole batch and names its index"""
+        response = await client.post("/activities/batch/signup", json={"ops": [
+            {"activity": "Debate Club", "email": NEW},
+            {"activity": "Nonexistent Club", "email": NEW},
+            {"activity": "Chess Club", "email": NEW},
+        ]})
+        assert response.status_code == 404
+        assert "operation 1 failed" in response.json()["detail"].lower()
+
+        assert NEW not in reset_activities["Debate Club"]["participants"]
+        assert NEW not in reset_activities["Chess Club"]["participants"]
+
+    async def test_batch_signup_rejects_duplicate_within_batch(self, client, reset_activities):
+        """Test that signing up twice in one batch fails without applying the first"""
+        response = await client.post("/activities/batch/signup", json={"ops": [
+            {"activity": "Chess Club", "email": NEW},
+            {"activity": "Chess Club", "email": NEW},
+        ]})
+        assert response.status_code == 400
+        assert "operation 1 failed" in response.json()["detail"].lower()
+
+        assert NEW not in reset_activities["Chess Club"]["participants"]
+
+
+class TestUnregisterFromActivity:
+    """Tests for the POST /activities/{activity_name}/unregister endpoint"""
+    
+    async def test_unregister_successfully(self, client):
+        """Test successful unregistration from an activity"""
+        response = await client.post(
+            f"/activities/Debate Club/unregister?email={ALEX}"
+        )
+        assert response.status_code == 200
+        assert b"Unregistered" in response.content
+    
+    async def test_unregister_removes_participant(self, client, reset_activities):
+        """Test that unregister actually removes the participant"""
+        await client.post(f"/activities/Debate Club/unregister?email={ALEX}")
+
+        assert ALEX not in reset_activities["Debate Club"]["participants"]
+    
+    async def test_unregister_multiple_participants(self, client, reset_activities):
+        """Test unregister when activity has multiple participants"""
+        # Science Olympiad has james@mergington.edu and lily@mergington.edu
+        response = await client.post(
+            f"/activities/Science Olympiad/unregister?email={JAMES}"
+        )
+        assert response.status_code == 200
+        
+        # Verify james is removed but lily remains
+        participants = set(reset_activities["Science Olympiad"]["participants"])
+        assert JAMES not in participants
+        assert LILY in participants
+
+
+class TestErrorResponses:
+    """Tests for the error responses of the signup and unregister endpoints"""
+
+    @pytest.mark.parametrize("url, status, detail", _ERROR_CASES)
+    async def test_error_paths(self, client, url, status, detail):
+        """Test that invalid signup and unregister requests are rejected"""
+        response = await client.post(url)
+        assert response.status_code == status
+        assert detail in response.json()["detail"].lower()
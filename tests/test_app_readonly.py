@@ -0,0 +1,46 @@
+import pytest
+
+import app
+
+
+@pytest.mark.asyncio
+class TestGetActivities:
+    """Tests for the GET /activities endpoint"""
+
+    async def test_get_activities_contract(self, client, baseline):
+        """Test the status, contents and structure of the activities listing"""
+        response = await client.get("/activities")
+        assert response.status_code == 200
+
+        # Returns all activities
+        activities = response.json()
+        assert len(activities) == len(baseline) == 9
+        assert "Debate Club" in activities
+        assert "Science Olympiad" in activities
+
+        # Activity objects have the correct structure
+        debate_club = activities["Debate Club"]
+        assert "description" in debate_club
+        assert "schedule" in debate_club
+        assert "max_participants" in debate_club
+        assert "participants" in debate_club
+        assert isinstance(debate_club["participants"], list)
+
+
+@pytest.mark.asyncio
+class TestRoot:
+    """Tests for the root endpoint"""
+
+    async def test_root_redirects(self, client):
+        """Test that root endpoint redirects to static page"""
+        response = await client.get("/", follow_redirects=False)
+        assert response.status_code == 307
+        assert "/static/index.html" in response.headers["location"]
+
+
+class TestActivityDatabase:
+    """Tests for the app's module-level activity database"""
+
+    def test_shipped_database_matches_baseline(self, baseline):
+        """Test that the app's own database still holds the baseline activities"""
+        assert app.activities == baseline